@@ -1,54 +1,65 @@
-from .client import Ioka
-from .exceptions import (
-    ConflictError,
-    Error,
-    NotFoundError,
-    StatusError,
-    TimeoutError,
-    UnauthenticatedError,
-    UnauthorizedError,
-    ValidationError,
-)
-from .models import (
-    EUR,
-    KZT,
-    RUB,
-    USD,
-    Account,
-    AccountResource,
-    AccountStatus,
-    Acquirer,
-    Action,
-    AmountCategory,
-    CaptureMethod,
-    CheckPosition,
-    Customer,
-    CustomerStatus,
-    DateCategory,
-    ErrorModel,
-    Event,
-    EventName,
-    Money,
-    Order,
-    OrderStatus,
-    Payer,
-    PayerType,
-    Payment,
-    PaymentStatus,
-    Refund,
-    RefundRule,
-    RefundStatus,
-    TaxType,
-)
+"""Ioka python client.
+
+Public names are imported lazily on first access. Set the
+``IOKA_EAGER_IMPORT`` environment variable to import all of them
+up front, e.g. to surface import errors early in CI."""
+
+import importlib
+import os
+import typing
+
 
+if typing.TYPE_CHECKING:
+    from .client import Ioka
+    from .exceptions import (
+        ConflictError,
+        Error,
+        NotFoundError,
+        StatusError,
+        TimeoutError,
+        UnauthenticatedError,
+        UnauthorizedError,
+        ValidationError,
+    )
+    from .models import (
+        EUR,
+        KZT,
+        RUB,
+        USD,
+        Account,
+        AccountResource,
+        AccountStatus,
+        Acquirer,
+        Action,
+        AmountCategory,
+        CaptureMethod,
+        CheckPosition,
+        Customer,
+        CustomerStatus,
+        DateCategory,
+        ErrorModel,
+        Event,
+        EventName,
+        Money,
+        Order,
+        OrderStatus,
+        Payer,
+        PayerType,
+        Payment,
+        PaymentStatus,
+        Refund,
+        RefundRule,
+        RefundStatus,
+        TaxType,
+    )
 
-__all__ = [
+
+__all__ = (
     'Account',
     'AccountResource',
     'AccountStatus',
     'Acquirer',
     'Action',
-    'AlreadyCreatedError',
     'AmountCategory',
     'CaptureMethod',
     'CheckPosition',
@@ -82,4 +93,75 @@ __all__ = [
     'UnauthenticatedError',
     'UnauthorizedError',
     'ValidationError',
-]
+)
+
+# Public name -> submodule it is defined in, resolved on first access.
+_LAZY = {
+    'Ioka': 'client',
+    'ConflictError': 'exceptions',
+    'Error': 'exceptions',
+    'NotFoundError': 'exceptions',
+    'StatusError': 'exceptions',
+    'TimeoutError': 'exceptions',
+    'UnauthenticatedError': 'exceptions',
+    'UnauthorizedError': 'exceptions',
+    'ValidationError': 'exceptions',
+    'EUR': 'models._money',
+    'KZT': 'models._money',
+    'RUB': 'models._money',
+    'USD': 'models._money',
+    'Account': 'models._account',
+    'AccountResource': 'models._account',
+    'AccountStatus': 'models._enums',
+    'Acquirer': 'models._common',
+    'Action': 'models._common',
+    'AmountCategory': 'models._enums',
+    'CaptureMethod': 'models._enums',
+    'CheckPosition': 'models._refund',
+    'Customer': 'models._customer',
+    'CustomerStatus': 'models._enums',
+    'DateCategory': 'models._enums',
+    'ErrorModel': 'models._common',
+    'Event': 'models._event',
+    'EventName': 'models._enums',
+    'Money': 'models._money',
+    'Order': 'models._order',
+    'OrderStatus': 'models._enums',
+    'Payer': 'models._payment',
+    'PayerType': 'models._enums',
+    'Payment': 'models._payment',
+    'PaymentStatus': 'models._enums',
+    'Refund': 'models._refund',
+    'RefundRule': 'models._refund',
+    'RefundStatus': 'models._enums',
+    'TaxType': 'models._enums',
+}
+
+
+# Submodules bound on the package once imported, e.g. ioka.exceptions.
+_SUBMODULES = frozenset(('client', 'exceptions', 'models'))
+
+
+def __getattr__(name: str):
+    if name in _SUBMODULES:
+        return importlib.import_module(f'.{name}', __name__)
+
+    module = _LAZY.get(name)
+
+    if module is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    value = getattr(importlib.import_module(f'.{module}', __name__), name)
+    # Cache, so subsequent accesses are plain module dict lookups.
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return list(__all__)
+
+
+if os.environ.get('IOKA_EAGER_IMPORT'):
+    for _name in __all__:
+        __getattr__(_name)
+    del _name
@@ -1,6 +1,10 @@
+import asyncio
 import datetime
+import enum
 import functools
-import os
+import math
+import operator
+import sys
 import typing
 
 import httpx
@@ -8,15 +12,85 @@ import httpx
 from . import exceptions, models
 
 
+try:
+    import orjson
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover
+    from json import loads as _json_loads
+
+    orjson = None
+
+
 _JsonTypes = typing.Union[dict, list]
 
+_JSON_CONTENT_TYPE = 'application/json'
+_JSON_SCALAR_TYPES = frozenset((str, int, bool, type(None)))
+
+# Keep idle connections around long enough to be reused between calls,
+# so subsequent requests skip the TCP and TLS handshakes.
+_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=100,
+    keepalive_expiry=60,
+)
+
+
+def _slice_datetime(d_str: str) -> datetime.datetime:
+    # Slices the fixed '%Y-%m-%dT%H:%M:%S.%f' layout directly, strptime
+    # interprets the format string on every call. An optional 'Z' or
+    # '+HH:MM' suffix is split off first, anything else is rejected.
+    end = len(d_str)
+    tzinfo = None
+    if d_str.endswith('Z'):
+        end -= 1
+        tzinfo = datetime.timezone.utc
+    elif end > 19 and d_str[-6] in '+-' and d_str[-3] == ':':
+        end -= 6
+        offset = datetime.timedelta(
+            hours=int(d_str[-5:-3]),
+            minutes=int(d_str[-2:]),
+        )
+        tzinfo = datetime.timezone(-offset if d_str[-6] == '-' else offset)
+    fraction = d_str[19:end]
+    if fraction and not (
+        fraction[0] == '.' and fraction[1:].isascii()
+        and fraction[1:].isdigit()
+    ):
+        raise ValueError(f'Invalid isoformat string: {d_str!r}')
+    return datetime.datetime(
+        int(d_str[0:4]),
+        int(d_str[5:7]),
+        int(d_str[8:10]),
+        int(d_str[11:13]),
+        int(d_str[14:16]),
+        int(d_str[17:19]),
+        int(fraction[1:7].ljust(6, '0')),
+        tzinfo=tzinfo,
+    )
+
+
+if sys.version_info >= (3, 11):
+    _parse_datetime = datetime.datetime.fromisoformat
+else:  # pragma: no cover
+    def _parse_datetime(d_str: str) -> datetime.datetime:
+        # Before 3.11 fromisoformat rejects the 'Z' suffix and fractions
+        # other than 3 or 6 digits, only those fall back to slicing.
+        try:
+            return datetime.datetime.fromisoformat(
+                d_str.replace('Z', '+00:00'),
+            )
+        except ValueError:
+            return _slice_datetime(d_str)
 
-def _parse_datetime(d_str: str) -> datetime.datetime:
-    return datetime.datetime.strptime(d_str, '%Y-%m-%dT%H:%M:%S.%f')
+
+_currency_mapping = {
+    money_cls.currency_code: money_cls
+    for money_cls in (models.KZT, models.USD, models.EUR, models.RUB)
+}
 
 
 def _get_money(amount: int, currency: str):
-    money_cls: models.Money = getattr(models, currency)
+    money_cls = _currency_mapping.get(currency)
 
     if money_cls is None:
         raise RuntimeError(f'Unrecognized currency {currency!r}')
@@ -24,17 +98,65 @@ def _get_money(amount: int, currency: str):
     return money_cls.from_minor(amount)
 
 
+def _is_plain_json(value) -> bool:
+    # Values both encoders turn into the same JSON, anything else, e.g.
+    # NaN, UUIDs, dates or non-str keys, may differ between them.
+    value_type = type(value)
+    if value_type in _JSON_SCALAR_TYPES:
+        return True
+    if value_type is float:
+        return math.isfinite(value)
+    if value_type is dict:
+        return all(
+            type(key) is str and _is_plain_json(item)
+            for key, item in value.items()
+        )
+    if value_type is list or value_type is tuple:
+        return all(map(_is_plain_json, value))
+    return False
+
+
+def _serialize_json_body(kwargs: dict) -> dict:
+    # httpx encodes 'json' bodies with the stdlib encoder, prefer orjson
+    # for plain bodies and leave everything else, like big ints, to httpx
+    # so it is encoded or rejected the same way with or without orjson.
+    if orjson is None or 'json' not in kwargs:
+        return kwargs
+    if not _is_plain_json(kwargs['json']):
+        return kwargs
+
+    try:
+        content = orjson.dumps(kwargs['json'])
+    except orjson.JSONEncodeError:
+        return kwargs
+
+    headers = httpx.Headers(kwargs.get('headers'))
+    headers.setdefault('Content-Type', _JSON_CONTENT_TYPE)
+    kwargs['headers'] = headers
+    kwargs['content'] = content
+    del kwargs['json']
+    return kwargs
+
+
+def _dict_to_account_resource(resource: dict) -> models.AccountResource:
+    return models.AccountResource(
+        id=resource['id'],
+        iban=resource.get('iban'),
+        is_default=resource.get('is_default'),
+    )
+
+
 def _drop_out_nones(entry: dict):
     return {k: v for k, v in entry.items() if v is not None}
 
 
-class _Auth(httpx.Auth):
-    def __init__(self, api_key) -> None:
-        self._api_key = api_key
+_enum_value = operator.attrgetter('value')
+_money_minors = operator.attrgetter('minors')
+_isoformat = operator.methodcaller('isoformat')
+
 
-    def auth_flow(self, request):
-        request.headers['api-key'] = self._api_key
-        yield request
+def _encode(value, encoder: typing.Callable):
+    return None if value is None else encoder(value)
 
 
 class _Client:
@@ -45,31 +167,68 @@ class _Client:
         api_key: str,
         base_url: str = 'https://stage-api.ioka.kz',
         timeout: typing.Optional[float] = None,
+        http2: bool = False,
     ) -> None:
         self._api_key = api_key
-        self._base_url = base_url
+        self._base_url = f"{base_url.rstrip('/')}/{self.version}"
         self._timeout = timeout
+        self._http2 = http2
 
     @functools.cached_property
     def _client(self):
         return httpx.Client(
-            auth=_Auth(self._api_key),
-            base_url=os.path.join(self._base_url, self.version),
+            headers={'api-key': self._api_key},
+            base_url=self._base_url,
             timeout=self._timeout,
+            limits=_LIMITS,
+            http2=self._http2,
         )
 
     @functools.cached_property
     def _a_client(self):
         return httpx.AsyncClient(
-            auth=_Auth(self._api_key),
-            base_url=os.path.join(self._base_url, self.version),
+            headers={'api-key': self._api_key},
+            base_url=self._base_url,
             timeout=self._timeout,
+            limits=_LIMITS,
+            http2=self._http2,
         )
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close pooled connections of the synchronous client."""
+        if '_client' in self.__dict__:
+            self.__dict__.pop('_client').close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close pooled connections of the asynchronous client."""
+        if '_a_client' in self.__dict__:
+            await self.__dict__.pop('_a_client').aclose()
+
     def _process(self, response: httpx.Response) -> _JsonTypes:
-        response_body = response.json()
+        is_success = 200 <= response.status_code < 300
 
-        if httpx.codes.is_success(response.status_code):
+        try:
+            response_body = _json_loads(response.content)
+        except ValueError:
+            # Error responses from proxies and gateways are often not JSON,
+            # report them by status code with the raw text as message.
+            if is_success:
+                raise
+            response_body = {}
+
+        if is_success:
             return response_body
 
         message = response_body.get('message') or response.text
@@ -87,7 +246,7 @@ class _Client:
                 self._client.request(
                     method=method,
                     url=url,
-                    **kwargs,
+                    **_serialize_json_body(kwargs),
                 ),
             )
         except httpx.TimeoutException as e:
@@ -101,7 +260,7 @@ class _Client:
                 await self._a_client.request(
                     method=method,
                     url=url,
-                    **kwargs,
+                    **_serialize_json_body(kwargs),
                 ),
             )
         except httpx.TimeoutException as e:
@@ -118,22 +277,16 @@ class Ioka(_Client):
 
     def _dict_to_account(self, account: dict) -> models.Account:
         resources = None
+        resources_ = account.get('resources')
 
-        if 'resources' in account and account['resources'] is not None:
-            resources = [
-                models.AccountResource(
-                    id=resource['id'],
-                    iban=resource.get('iban'),
-                    is_default=resource.get('is_default'),
-                )
-                for resource in account['resources']
-            ]
+        if resources_ is not None:
+            resources = tuple(map(_dict_to_account_resource, resources_))
 
         return models.Account(
             id=account['id'],
             shop_id=account['shop_id'],
             customer_id=account.get('customer_id'),
-            status=models.AccountStatus(account['status']),
+            status=models.AccountStatus.from_str(account['status']),
             name=account.get('name'),
             # TODO: Discuss, mismatch with the specification
             amount=_get_money(
@@ -147,17 +300,15 @@ class Ioka(_Client):
 
     def _dict_to_customer(self, customer: dict) -> models.Customer:
         accounts = None
+        accounts_ = customer.get('accounts')
 
-        if 'accounts' in customer and customer['accounts'] is not None:
-            accounts = [
-                self._dict_to_account(account)
-                for account in customer['accounts']
-            ]
+        if accounts_ is not None:
+            accounts = tuple(map(self._dict_to_account, accounts_))
 
         return models.Customer(
             id=customer['id'],
             created_at=_parse_datetime(customer['created_at']),
-            status=models.CustomerStatus(customer['status']),
+            status=models.CustomerStatus.from_str(customer['status']),
             # TODO: Discuss, mismatch with the specification
             external_id=customer.get('external_id'),
             email=customer.get('email'),
@@ -169,10 +320,10 @@ class Ioka(_Client):
 
     def _dict_to_payment(self, payment: dict) -> models.Payment:
         payer = None
-        if 'payer' in payment and payment['payer'] is not None:
-            payer_ = payment['payer']
+        payer_ = payment.get('payer')
+        if payer_ is not None:
             payer = models.Payer(
-                type=models.PayerType(payer_['type']),
+                type=models.PayerType.from_str(payer_['type']),
                 pan_masked=payer_['pan_masked'],
                 expiry_date=payer_['expiry_date'],
                 holder=payer_['holder'],
@@ -184,29 +335,32 @@ class Ioka(_Client):
                 card_id=payer_['card_id'],
             )
         error = None
-        if 'error' in payment and payment['error'] is not None:
+        error_ = payment.get('error')
+        if error_ is not None:
             error = models.ErrorModel(
-                code=payment['error']['code'],
-                message=payment['error']['message'],
+                code=error_['code'],
+                message=error_['message'],
             )
 
         acquirer = None
-        if 'acquirer' in payment and payment['acquirer'] is not None:
+        acquirer_ = payment.get('acquirer')
+        if acquirer_ is not None:
             acquirer = models.Acquirer(
-                name=payment['acquirer']['name'],
-                reference=payment['acquirer']['reference'],
+                name=acquirer_['name'],
+                reference=acquirer_['reference'],
             )
         action = None
-        if 'action' in payment and payment['action'] is not None:
+        action_ = payment.get('action')
+        if action_ is not None:
             action = models.Action(
-                url=payment['action']['url'],
+                url=action_['url'],
             )
 
         return models.Payment(
             id=payment['id'],
             shop_id=payment['shop_id'],
             order_id=payment['order_id'],
-            status=models.PaymentStatus(payment['status']),
+            status=models.PaymentStatus.from_str(payment['status']),
             created_at=_parse_datetime(payment['created_at']),
             approved_amount=payment['approved_amount'],
             captured_amount=payment['captured_amount'],
@@ -220,21 +374,21 @@ class Ioka(_Client):
 
     def _dict_to_order(self, order: dict) -> models.Order:
         payments = None
+        payments_ = order.get('payments')
 
-        if 'payments' in order and order['payments'] is not None:
-            payments = [
-                self._dict_to_order(payment)
-                for payment in order['payments']
-            ]
+        if payments_ is not None:
+            payments = tuple(map(self._dict_to_payment, payments_))
 
         return models.Order(
             client=self,
             id=order['id'],
             shop_id=order['shop_id'],
-            status=models.OrderStatus(order['status']),
+            status=models.OrderStatus.from_str(order['status']),
             created_at=_parse_datetime(order['created_at']),
             amount=_get_money(order['amount'], order['currency']),
-            capture_method=models.CaptureMethod(order['capture_method']),
+            capture_method=models.CaptureMethod.from_str(
+                order['capture_method'],
+            ),
             external_id=order['external_id'],
             description=order['description'],
             extra_info=order['extra_info'],
@@ -249,22 +403,24 @@ class Ioka(_Client):
 
     def _dict_to_refund(self, refund: dict) -> models.Refund:
         error = None
-        if 'error' in refund and refund['error'] is not None:
+        error_ = refund.get('error')
+        if error_ is not None:
             error = models.ErrorModel(
-                code=refund['error']['code'],
-                message=refund['error']['message'],
+                code=error_['code'],
+                message=error_['message'],
             )
         acquirer = None
-        if 'acquirer' in refund and refund['acquirer'] is not None:
+        acquirer_ = refund.get('acquirer')
+        if acquirer_ is not None:
             acquirer = models.Acquirer(
-                name=refund['acquirer']['name'],
-                reference=refund['acquirer']['reference'],
+                name=acquirer_['name'],
+                reference=acquirer_['reference'],
             )
         return models.Refund(
             id=refund['id'],
             payment_id=refund['payment_id'],
             order_id=refund['order_id'],
-            status=models.RefundStatus(refund['status']),
+            status=models.RefundStatus.from_str(refund['status']),
             created_at=_parse_datetime(refund['created_at']),
             error=error,
             acquirer=acquirer,
@@ -284,26 +440,13 @@ class Ioka(_Client):
                     'amount': rule.amount.minors,
                 } for rule in rules
             ]
-        if positions is not None:
-            positions = [
-                _drop_out_nones({
-                    'name': position.name,
-                    'amount': position.amount.minors,
-                    'section': position.section,
-                    'tax_percent': position.tax_percent,
-                    'tax_type': (
-                        position.tax_type.value
-                        if position.tax_type is not None else None
-                    ),
-                    'tax_amount': position.tax_amount,
-                    'unit_code': position.unit_code,
-                }) for position in positions
-            ]
-        return _drop_out_nones({
-            'amount': amount.minors,
-            'reason': reason,
-            'rules': rules,
-        })
+        # TODO: Check positions are not sent yet.
+        body = {'amount': amount.minors}
+        if reason is not None:
+            body['reason'] = reason
+        if rules is not None:
+            body['rules'] = rules
+        return body
 
     def _prepare_order_create_body(
         self,
@@ -322,22 +465,35 @@ class Ioka(_Client):
         failure_url: typing.Optional[str] = None,
         template: typing.Optional[str] = None,
     ) -> dict:
-        return _drop_out_nones({
+        body = {
             'amount': amount.minors,
             'capture_method': capture_method.value,
-            'external_id': external_id,
-            'description': description,
-            'mcc': mcc,
-            'extra_info': extra_info,
-            'attempts': attempts,
-            'due_date': due_date.isoformat() if due_date is not None else None,
-            'customer_id': customer_id,
-            'card_id': card_id,
-            'back_url': back_url,
-            'success_url': success_url,
-            'failure_url': failure_url,
-            'template': template,
-        })
+        }
+        if external_id is not None:
+            body['external_id'] = external_id
+        if description is not None:
+            body['description'] = description
+        if mcc is not None:
+            body['mcc'] = mcc
+        if extra_info is not None:
+            body['extra_info'] = extra_info
+        if attempts is not None:
+            body['attempts'] = attempts
+        if due_date is not None:
+            body['due_date'] = due_date.isoformat()
+        if customer_id is not None:
+            body['customer_id'] = customer_id
+        if card_id is not None:
+            body['card_id'] = card_id
+        if back_url is not None:
+            body['back_url'] = back_url
+        if success_url is not None:
+            body['success_url'] = success_url
+        if failure_url is not None:
+            body['failure_url'] = failure_url
+        if template is not None:
+            body['template'] = template
+        return body
 
     def _prepare_pagination_filter_params(
         self,
@@ -348,7 +504,7 @@ class Ioka(_Client):
         date_category: typing.Optional[models.DateCategory] = None,
         customer_id: typing.Optional[str] = None,
         external_id: typing.Optional[str] = None,
-        status: typing.Optional[models.enum.Enum] = None,
+        status: typing.Optional[enum.Enum] = None,
         order_id: typing.Optional[str] = None,
         payment_id: typing.Optional[str] = None,
         pan_first6: typing.Optional[str] = None,
@@ -365,36 +521,24 @@ class Ioka(_Client):
         return _drop_out_nones({
             'page': page,
             'limit': limit,
-            'from_dt': from_dt.isoformat() if from_dt is not None else None,
-            'to_dt': to_dt.isoformat() if to_dt is not None else None,
-            'date_category': (
-                date_category.value if date_category is not None else None
-            ),
+            'from_dt': _encode(from_dt, _isoformat),
+            'to_dt': _encode(to_dt, _isoformat),
+            'date_category': _encode(date_category, _enum_value),
             'customer_id': customer_id,
             'external_id': external_id,
-            'status': status.value if status is not None else None,
+            'status': _encode(status, _enum_value),
             'order_id': order_id,
             'payment_id': payment_id,
             'pan_first6': pan_first6,
             'pan_last4': pan_last4,
             'payer_email': payer_email,
             'payer_phone': payer_phone,
-            'payment_status': (
-                payment_status.value if payment_status is not None else None
-            ),
+            'payment_status': _encode(payment_status, _enum_value),
             'payment_system': payment_system,
-            'amount_category': (
-                amount_category.value if amount_category is not None else None
-            ),
-            'fixed_amount': (
-                fixed_amount.minors if fixed_amount is not None else None
-            ),
-            'min_amount': (
-                min_amount.minors if min_amount is not None else None
-            ),
-            'max_amount': (
-                max_amount.minors if max_amount is not None else None
-            ),
+            'amount_category': _encode(amount_category, _enum_value),
+            'fixed_amount': _encode(fixed_amount, _money_minors),
+            'min_amount': _encode(min_amount, _money_minors),
+            'max_amount': _encode(max_amount, _money_minors),
         })
 
     def create_order(
@@ -527,6 +671,26 @@ class Ioka(_Client):
             )
         ]
 
+    async def a_get_orders_pages(
+        self,
+        pages: typing.Iterable[int],
+        limit: int = 10,
+        from_dt: typing.Optional[datetime.datetime] = None,
+        to_dt: typing.Optional[datetime.datetime] = None,
+        date_category: typing.Optional[models.DateCategory] = None,
+    ) -> list[list[models.Order]]:
+        """Fetch several pages of orders concurrently, in the given order."""
+        return list(await asyncio.gather(*(
+            self.a_get_orders(
+                page=page,
+                limit=limit,
+                from_dt=from_dt,
+                to_dt=to_dt,
+                date_category=date_category,
+            )
+            for page in pages
+        )))
+
     def capture_order(
         self,
         order_id: str,
@@ -813,7 +977,7 @@ class Ioka(_Client):
     ) -> list[models.Customer]:
         return [
             self._dict_to_customer(customer)
-            for customer in self._a_request(
+            for customer in await self._a_request(
                 'get',
                 '/customers',
                 params=self._prepare_pagination_filter_params(
@@ -838,5 +1002,5 @@ class Ioka(_Client):
     async def a_get_accounts(self) -> list[models.Account]:
         return [
             self._dict_to_account(account)
-            for account in await self._request('get', '/accounts')
+            for account in await self._a_request('get', '/accounts')
         ]
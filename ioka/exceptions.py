@@ -1,4 +1,4 @@
-import httpx
+import typing
 
 
 class Error(Exception):
@@ -12,80 +12,108 @@ class TimeoutError(Error):
 class StatusError(Error):
     """Base class for all ioka response related errors."""
 
-    status_code: httpx.codes
+    status_code: int
     message: str
     code: str
+    _str: str
+    _repr: typing.Optional[str]
 
     def __init__(self, status_code: int, message: str, code: str) -> None:
         self.status_code = status_code
+        self._set_text(message, code)
+
+    def _set_text(self, message: str, code: str) -> None:
         self.message = message
         self.code = code
+        self._str = f'{code}: {message}'
+        self._repr = None
 
     def __str__(self) -> str:
-        return f'{self.code}: {self.message}'
+        return self._str
 
     def __repr__(self) -> str:
-        return (
-            f'{self.__class__.__name__}('
-            f'status_code={self.status_code!r}, '
-            f'message={self.message!r}, '
-            f'code={self.code!r})'
-        )
+        if self._repr is None:
+            self._repr = (
+                f'{self.__class__.__name__}('
+                f'status_code={self.status_code!r}, '
+                f'message={self.message!r}, '
+                f'code={self.code!r})'
+            )
+        return self._repr
 
 
-class ValidationError(StatusError):
-    """Raises on validation errors."""
+class _FixedStatusError(StatusError):
+    """Base class for errors bound to a single status code.
+
+    The code is stored once on the class, instances only keep the
+    response message and code."""
 
     def __init__(self, message: str, code: str) -> None:
-        super().__init__(httpx.codes.BAD_REQUEST, message, code)
+        self._set_text(message, code)
+
+
+class ValidationError(_FixedStatusError):
+    """Raises on validation errors."""
+
+    status_code = 400
 
 
-class UnauthenticatedError(StatusError):
+class UnauthenticatedError(_FixedStatusError):
     """Raises on unauthenticated access.
 
     Commonly on invalid credentials."""
 
-    def __init__(self, message: str, code: str) -> None:
-        super().__init__(httpx.codes.UNAUTHORIZED, message, code)
+    status_code = 401
 
 
-class UnauthorizedError(StatusError):
+class UnauthorizedError(_FixedStatusError):
     """Raises on unauthorized access.
 
     Commonly if permission is not granted for the resource."""
 
-    def __init__(self, message: str, code: str) -> None:
-        super().__init__(httpx.codes.FORBIDDEN, message, code)
+    status_code = 403
 
 
-class NotFoundError(StatusError):
+class NotFoundError(_FixedStatusError):
     """Raises if resource is not found."""
 
-    def __init__(self, message: str, code: str) -> None:
-        super().__init__(httpx.codes.NOT_FOUND, message, code)
+    status_code = 404
 
 
-class ConflictError(StatusError):
+class ConflictError(_FixedStatusError):
     """Raises if resource is already created or operation is impossible."""
 
-    def __init__(self, message: str, code: str) -> None:
-        super().__init__(httpx.codes.CONFLICT, message, code)
+    status_code = 409
 
 
 _status_error_mapping = {
-    httpx.codes.BAD_REQUEST: ValidationError,
-    httpx.codes.UNAUTHORIZED: UnauthenticatedError,
-    httpx.codes.FORBIDDEN: UnauthorizedError,
-    httpx.codes.NOT_FOUND: NotFoundError,
-    httpx.codes.CONFLICT: ConflictError,
+    error_cls.status_code: error_cls
+    for error_cls in (
+        ValidationError,
+        UnauthenticatedError,
+        UnauthorizedError,
+        NotFoundError,
+        ConflictError,
+    )
 }
 
 
+# Indexed directly by status code, a single lookup on the error path.
+_status_error_table = tuple(
+    _status_error_mapping.get(status_code)
+    for status_code in range(600)
+)
+
+
 def get_status_error(
     status_code: int,
     message: str,
     code: str,
 ) -> StatusError:
-    if status_code in _status_error_mapping:
-        return _status_error_mapping[status_code](message, code)
+    error_cls = None
+    if 0 <= status_code < len(_status_error_table):
+        error_cls = _status_error_table[status_code]
+
+    if error_cls is not None:
+        return error_cls(message, code)
     return StatusError(status_code, message, code)
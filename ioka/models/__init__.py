@@ -0,0 +1,108 @@
+import importlib
+import typing
+
+
+if typing.TYPE_CHECKING:
+    from ._account import Account, AccountResource
+    from ._common import Acquirer, Action, ErrorModel
+    from ._customer import Customer
+    from ._enums import (
+        AccountStatus,
+        AmountCategory,
+        CaptureMethod,
+        CustomerStatus,
+        DateCategory,
+        EventName,
+        OrderStatus,
+        PayerType,
+        PaymentStatus,
+        RefundStatus,
+        TaxType,
+    )
+    from ._event import Event
+    from ._money import EUR, KZT, RUB, USD, Money
+    from ._order import Order
+    from ._payment import Payer, Payment
+    from ._refund import CheckPosition, Refund, RefundRule
+
+
+__all__ = (
+    'Account',
+    'AccountResource',
+    'AccountStatus',
+    'Acquirer',
+    'Action',
+    'AmountCategory',
+    'CaptureMethod',
+    'CheckPosition',
+    'Customer',
+    'CustomerStatus',
+    'DateCategory',
+    'EUR',
+    'ErrorModel',
+    'Event',
+    'EventName',
+    'KZT',
+    'Money',
+    'Order',
+    'OrderStatus',
+    'Payer',
+    'PayerType',
+    'Payment',
+    'PaymentStatus',
+    'RUB',
+    'Refund',
+    'RefundRule',
+    'RefundStatus',
+    'TaxType',
+    'USD',
+)
+
+# Model name -> submodule it is defined in, resolved on first access.
+_LAZY = {
+    'Account': '_account',
+    'AccountResource': '_account',
+    'Acquirer': '_common',
+    'Action': '_common',
+    'ErrorModel': '_common',
+    'Customer': '_customer',
+    'AccountStatus': '_enums',
+    'AmountCategory': '_enums',
+    'CaptureMethod': '_enums',
+    'CustomerStatus': '_enums',
+    'DateCategory': '_enums',
+    'EventName': '_enums',
+    'OrderStatus': '_enums',
+    'PayerType': '_enums',
+    'PaymentStatus': '_enums',
+    'RefundStatus': '_enums',
+    'TaxType': '_enums',
+    'Event': '_event',
+    'EUR': '_money',
+    'KZT': '_money',
+    'Money': '_money',
+    'RUB': '_money',
+    'USD': '_money',
+    'Order': '_order',
+    'Payer': '_payment',
+    'Payment': '_payment',
+    'CheckPosition': '_refund',
+    'Refund': '_refund',
+    'RefundRule': '_refund',
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+
+    if module is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    value = getattr(importlib.import_module(f'.{module}', __name__), name)
+    # Cache, so subsequent accesses are plain module dict lookups.
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return list(__all__)
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import typing
+
+from ._common import _SLOTS
+from ._enums import AccountStatus
+from ._money import Money
+
+
+@dataclasses.dataclass(**_SLOTS)
+class AccountResource:
+    id: str
+    iban: str
+    is_default: bool
+
+
+@dataclasses.dataclass(**_SLOTS)
+class Account:
+    id: str
+    shop_id: str
+    customer_id: typing.Optional[str]
+    status: AccountStatus
+    name: str
+    # TODO: Mismatch with the specification
+    amount: typing.Optional[Money]
+    resources: typing.Optional[tuple[AccountResource, ...]]
+    created_at: datetime.datetime
+    external_id: typing.Optional[str]
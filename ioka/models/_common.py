@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import dataclasses
+import sys
+import typing
+
+
+# Slotted models drop the per-instance __dict__, supported since 3.10.
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclasses.dataclass(**_SLOTS)
+class ErrorModel:
+    code: str
+    message: str
+
+
+@dataclasses.dataclass(**_SLOTS)
+class Acquirer:
+    name: str
+    reference: typing.Optional[str]
+
+
+@dataclasses.dataclass(**_SLOTS)
+class Action:
+    url: str
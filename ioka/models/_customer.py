@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import typing
+
+from ._account import Account
+from ._common import _SLOTS
+from ._enums import CustomerStatus
+
+
+@dataclasses.dataclass(**_SLOTS)
+class Customer:
+    id: str
+    created_at: datetime.datetime
+    status: CustomerStatus
+    external_id: typing.Optional[str]
+    email: typing.Optional[str]
+    phone: typing.Optional[str]
+    accounts: typing.Optional[tuple[Account, ...]]
+    checkout_url: str
+    access_token: str
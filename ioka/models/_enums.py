@@ -0,0 +1,112 @@
+import enum
+
+
+class _StrEnum(str, enum.Enum):
+    @classmethod
+    def from_str(cls, value: str):
+        """Return the member for value with a plain dict lookup."""
+        member = cls._value2member_map_.get(value)
+        if member is None:
+            # Raises the usual ValueError for unknown values.
+            return cls(value)
+        return member
+
+
+class AmountCategory(_StrEnum):
+    FIXED = 'FIXED'
+    RANGE = 'RANGE'
+
+
+class DateCategory(_StrEnum):
+    DAILY = 'DAILY'
+    MONTHLY = 'MONTHLY'
+    QUARTERLY = 'QUARTERLY'
+    YEARLY = 'YEARLY'
+    MANUAL = 'MANUAL'
+
+
+class OrderStatus(_StrEnum):
+    UNPAID = 'UNPAID'
+    ON_HOLD = 'ON_HOLD'
+    PAID = 'PAID'
+    EXPIRED = 'EXPIRED'
+
+
+class PaymentStatus(_StrEnum):
+    PENDING = 'PENDING'
+    REQUIRES_ACTION = 'REQUIRES_ACTION'
+    APPROVED = 'APPROVED'
+    CAPTURED = 'CAPTURED'
+    CANCELLED = 'CANCELLED'
+    DECLINED = 'DECLINED'
+
+
+class RefundStatus(_StrEnum):
+    PENDING = 'PENDING'
+    APPROVED = 'APPROVED'
+    DECLINED = 'DECLINED'
+
+
+class CaptureMethod(_StrEnum):
+    AUTO = 'AUTO'
+    MANUAL = 'MANUAL'
+
+
+class PayerType(_StrEnum):
+    CARD = 'CARD'
+    CARD_NO_CVC = 'CARD_NO_CVC'
+    CARD_WITH_BINDING = 'CARD_WITH_BINDING'
+    BINDING = 'BINDING'
+    APPLE_PAY = 'APPLE_PAY'
+    GOOGLE_PAY = 'GOOGLE_PAY'
+    MASTERPASS = 'MASTERPASS'
+
+
+class EventName(_StrEnum):
+    ORDER_CREATED = 'ORDER_CREATED'
+    PAYMENT_CREATED = 'PAYMENT_CREATED'
+    REFUND_CREATED = 'REFUND_CREATED'
+    INSTALLMENT_CREATED = 'INSTALLMENT_CREATED'
+    SPLIT_CREATED = 'SPLIT_CREATED'
+    ORDER_ON_HOLD = 'ORDER_ON_HOLD'
+    ORDER_PAID = 'ORDER_PAID'
+    ORDER_EXPIRED = 'ORDER_EXPIRED'
+    PAYMENT_DECLINED = 'PAYMENT_DECLINED'
+    PAYMENT_ACTION_REQUIRED = 'PAYMENT_ACTION_REQUIRED'
+    PAYMENT_APPROVED = 'PAYMENT_APPROVED'
+    PAYMENT_CAPTURED = 'PAYMENT_CAPTURED'
+    CAPTURE_DECLINED = 'CAPTURE_DECLINED'
+    PAYMENT_CANCELLED = 'PAYMENT_CANCELLED'
+    CANCEL_DECLINED = 'CANCEL_DECLINED'
+    REFUND_APPROVED = 'REFUND_APPROVED'
+    REFUND_DECLINED = 'REFUND_DECLINED'
+    SPLIT_APPROVED = 'SPLIT_APPROVED'
+    SPLIT_DECLINED = 'SPLIT_DECLINED'
+    SPLIT_REFUND_APPROVED = 'SPLIT_REFUND_APPROVED'
+    SPLIT_REFUND_DECLINED = 'SPLIT_REFUND_DECLINED'
+    CHECK_APPROVED = 'CHECK_APPROVED'
+    CHECK_DECLINED = 'CHECK_DECLINED'
+    OTP_SENT = 'OTP_SENT'
+    SEND_OTP_DECLINED = 'SEND_OTP_DECLINED'
+    OTP_CONFIRMED = 'OTP_CONFIRMED'
+    CONFIRM_OTP_DECLINED = 'CONFIRM_OTP_DECLINED'
+    INSTALLMENT_ACTION_REQUIRED = 'INSTALLMENT_ACTION_REQUIRED'
+    INSTALLMENT_ISSUED = 'INSTALLMENT_ISSUED'
+    INSTALLMENT_REJECTED = 'INSTALLMENT_REJECTED'
+    INSTALLMENT_DECLINED = 'INSTALLMENT_DECLINED'
+
+
+class CustomerStatus(_StrEnum):
+    PENDING = 'PENDING'
+    READY = 'READY'
+
+
+class AccountStatus(_StrEnum):
+    PENDING = 'PENDING'
+    ACCEPTED = 'ACCEPTED'
+    BLOCKED = 'BLOCKED'
+
+
+class TaxType(enum.IntEnum):
+    WITHOUT = 0
+    WITH = 100
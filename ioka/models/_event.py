@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import typing
+
+from ._common import _SLOTS, ErrorModel
+from ._enums import EventName
+
+
+@dataclasses.dataclass(**_SLOTS)
+class Event(ErrorModel):
+    id: str
+    name: EventName
+    created_at: datetime.datetime
+    order_id: str
+    payment_id: typing.Optional[str]
+    refund_id: typing.Optional[str]
+    md: typing.Optional[str]
+    pa_req: typing.Optional[str]
+    acs_url: typing.Optional[str]
+    term_url: typing.Optional[str]
+    action_url: typing.Optional[str]
@@ -0,0 +1,75 @@
+import decimal
+import typing
+
+
+_MoneyAmountTypes = typing.Union[int, float, decimal.Decimal]
+
+
+class Money:
+    __slots__ = ('_minors',)
+
+    minor_factor: int
+    currency_code: str
+    ZERO: 'Money'
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        # Shared zero amount per currency, see from_minor.
+        cls.ZERO = cls.__new__(cls)
+        cls.ZERO._minors = 0
+
+    def __init__(
+        self,
+        value: _MoneyAmountTypes,
+    ) -> None:
+        # Amounts are kept in minor units, as they are sent to the API.
+        # Going through str avoids binary float errors, e.g. 10.07.
+        minors = decimal.Decimal(str(value)) * self.minor_factor
+        self._minors = int(minors.to_integral_value(decimal.ROUND_HALF_UP))
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.value})'
+
+    @classmethod
+    def from_minor(cls, value: int):
+        if value == 0:
+            return cls.ZERO
+        money = cls.__new__(cls)
+        money._minors = int(value)
+        return money
+
+    @property
+    def minors(self) -> int:
+        return self._minors
+
+    @property
+    def value(self) -> decimal.Decimal:
+        return decimal.Decimal(self._minors) / self.minor_factor
+
+
+class KZT(Money):
+    __slots__ = ()
+
+    currency_code = 'KZT'
+    minor_factor = 100
+
+
+class USD(Money):
+    __slots__ = ()
+
+    currency_code = 'USD'
+    minor_factor = 100
+
+
+class EUR(Money):
+    __slots__ = ()
+
+    currency_code = 'EUR'
+    minor_factor = 100
+
+
+class RUB(Money):
+    __slots__ = ()
+
+    currency_code = 'RUB'
+    minor_factor = 100
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import typing
+
+from ._common import _SLOTS
+from ._enums import CaptureMethod, OrderStatus
+from ._money import Money
+from ._payment import Payment
+
+
+Ioka = typing.Any
+
+if typing.TYPE_CHECKING:
+    from .. import client
+    from ._event import Event
+    from ._refund import Refund
+
+    Ioka = client.Ioka
+
+
+@dataclasses.dataclass(**_SLOTS)
+class _Model:
+    client: Ioka = dataclasses.field(
+        init=True,
+        repr=False,
+    )
+
+
+@dataclasses.dataclass(**_SLOTS)
+class Order(_Model):
+    id: str
+    shop_id: str
+    status: OrderStatus
+    created_at: datetime.datetime
+    amount: Money
+    capture_method: CaptureMethod
+    external_id: typing.Optional[str]
+    description: typing.Optional[str]
+    extra_info: typing.Optional[dict]
+    mcc: typing.Optional[str]
+    acquirer: typing.Optional[str]
+    customer_id: typing.Optional[str]
+    card_id: typing.Optional[str]
+    attempts: typing.Optional[int]
+    checkout_url: str
+    payments: typing.Optional[tuple[Payment, ...]]
+
+    def cancel(self, reason: typing.Optional[str] = None) -> Payment:
+        return self.client.cancel_order(self.id, reason=reason)
+
+    async def a_cancel(self, reason: typing.Optional[str] = None) -> Payment:
+        return await self.client.a_cancel_order(self.id, reason=reason)
+
+    def capture(
+        self,
+        amount: typing.Optional[Money] = None,
+        reason: typing.Optional[str] = None,
+    ) -> Payment:
+        if amount is None:
+            return self.client.capture_order(
+                self.id,
+                self.amount,
+                reason=reason,
+            )
+        return self.client.capture_order(self.id, amount, reason=reason)
+
+    async def a_capture(
+        self,
+        amount: typing.Optional[Money] = None,
+        reason: typing.Optional[str] = None,
+    ) -> Payment:
+        if amount is None:
+            return await self.client.a_capture_order(
+                self.id,
+                self.amount,
+                reason=reason,
+            )
+        return await self.client.a_capture_order(
+            self.id,
+            amount,
+            reason=reason,
+        )
+
+    def update(self) -> None:
+        self.client.update_order(self.id, self.amount)
+
+    async def a_update(self) -> None:
+        await self.client.a_update_order(self.id, self.amount)
+
+    def get_refunds(self) -> list[Refund]:
+        return self.client.get_refunds(self.id)
+
+    async def a_get_refunds(self) -> list[Refund]:
+        return await self.client.a_get_refunds(self.id)
+
+    def get_payments(self) -> list[Payment]:
+        return self.client.get_payments(self.id)
+
+    async def a_get_payments(self) -> list[Payment]:
+        return await self.client.a_get_payments(self.id)
+
+    def get_events(self) -> list[Event]:
+        # TODO: Finish it!
+        return self.client.get_events(self.id)
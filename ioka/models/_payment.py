@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import typing
+
+from ._common import _SLOTS, Acquirer, Action, ErrorModel
+from ._enums import PayerType, PaymentStatus
+
+
+@dataclasses.dataclass(**_SLOTS)
+class Payer:
+    type: PayerType
+    pan_masked: typing.Optional[str]
+    expiry_date: typing.Optional[str]
+    holder: typing.Optional[str]
+    payment_system: typing.Optional[str]
+    emitter: typing.Optional[str]
+    email: typing.Optional[str]
+    phone: typing.Optional[str]
+    customer_id: typing.Optional[str]
+    card_id: typing.Optional[str]
+
+
+# TODO: Change amount type to Money
+@dataclasses.dataclass(**_SLOTS)
+class Payment:
+    id: str
+    shop_id: typing.Optional[str]
+    order_id: str
+    status: PaymentStatus
+    created_at: datetime.datetime
+    approved_amount: int
+    captured_amount: int
+    refunded_amount: int
+    processing_fee: float
+    payer: typing.Optional[Payer]
+    error: typing.Optional[ErrorModel]
+    acquirer: typing.Optional[Acquirer]
+    action: typing.Optional[Action]
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import typing
+
+from ._common import _SLOTS, Acquirer, ErrorModel
+from ._enums import RefundStatus, TaxType
+from ._money import Money
+
+
+@dataclasses.dataclass(**_SLOTS)
+class RefundRule:
+    account_id: str
+    amount: Money
+
+
+@dataclasses.dataclass(**_SLOTS)
+class Refund:
+    id: str
+    payment_id: str
+    order_id: str
+    status: RefundStatus
+    created_at: typing.Optional[datetime.datetime]
+    error: typing.Optional[ErrorModel]
+    acquirer: typing.Optional[Acquirer]
+
+
+# TODO: Change ints to Money if necessary
+@dataclasses.dataclass(**_SLOTS)
+class CheckPosition:
+    name: str
+    amount: Money
+    count: int
+    section: int
+    tax_percent: int
+    tax_type: TaxType = TaxType.WITHOUT
+    tax_amount: int = 0
+    unit_code: int = 0
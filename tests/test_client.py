@@ -0,0 +1,294 @@
+import datetime
+import enum
+import json
+import uuid
+
+import httpx
+import pytest
+
+import ioka
+from ioka.client import _serialize_json_body, _slice_datetime
+
+
+CREATED_AT = '2023-01-01T10:00:00.123456'
+
+ACCOUNT = {
+    'id': 'account-id',
+    'shop_id': 'shop-id',
+    'status': 'ACCEPTED',
+    'created_at': CREATED_AT,
+    'amount': 500,
+    'resources': [{'id': 'resource-id', 'iban': 'KZ00', 'is_default': True}],
+}
+
+CUSTOMER = {
+    'id': 'customer-id',
+    'created_at': CREATED_AT,
+    'status': 'READY',
+    'accounts': [ACCOUNT],
+    'checkout_url': 'https://checkout',
+    'access_token': 'token',
+}
+
+PAYMENT = {
+    'id': 'payment-id',
+    'shop_id': 'shop-id',
+    'order_id': 'order-id',
+    'status': 'CAPTURED',
+    'created_at': CREATED_AT,
+    'approved_amount': 1050,
+    'captured_amount': 1050,
+    'refunded_amount': 0,
+    'processing_fee': 1.5,
+    'payer': None,
+    'error': None,
+    'acquirer': {'name': 'acquirer', 'reference': None},
+    'action': None,
+}
+
+ORDER = {
+    'id': 'order-id',
+    'shop_id': 'shop-id',
+    'status': 'PAID',
+    'created_at': CREATED_AT,
+    'amount': 1050,
+    'currency': 'KZT',
+    'capture_method': 'AUTO',
+    'external_id': None,
+    'description': None,
+    'extra_info': None,
+    'mcc': None,
+    'acquirer': None,
+    'customer_id': None,
+    'card_id': None,
+    'attempts': 1,
+    'checkout_url': 'https://checkout',
+    'payments': [PAYMENT, dict(PAYMENT, id='other-payment-id')],
+}
+
+
+@pytest.fixture
+def responses():
+    return {
+        '/v2/accounts': [ACCOUNT],
+        '/v2/customers': [CUSTOMER],
+    }
+
+
+@pytest.fixture
+def client(responses):
+    def handler(request: httpx.Request) -> httpx.Response:
+        response = responses[request.url.path]
+        if isinstance(response, httpx.Response):
+            return response
+        return httpx.Response(200, json=response)
+
+    client = ioka.Ioka('api-key', base_url='https://ioka.test')
+    client.__dict__['_a_client'] = httpx.AsyncClient(
+        base_url='https://ioka.test/v2',
+        transport=httpx.MockTransport(handler),
+    )
+    return client
+
+
+@pytest.mark.asyncio
+async def test_a_get_accounts(client):
+    accounts = await client.a_get_accounts()
+
+    assert [account.id for account in accounts] == ['account-id']
+    assert accounts[0].resources[0].iban == 'KZ00'
+    # The blocking client must not be used from the async method.
+    assert '_client' not in client.__dict__
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_a_get_customers(client):
+    customers = await client.a_get_customers()
+
+    assert [customer.id for customer in customers] == ['customer-id']
+    assert customers[0].accounts[0].id == 'account-id'
+    assert '_client' not in client.__dict__
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_error_response_json(client, responses):
+    responses['/v2/accounts'] = httpx.Response(
+        404,
+        json={'code': 'NotFound', 'message': 'Account not found'},
+    )
+
+    with pytest.raises(ioka.NotFoundError) as error_info:
+        await client.a_get_accounts()
+
+    assert error_info.value.status_code == 404
+    assert error_info.value.code == 'NotFound'
+    assert error_info.value.message == 'Account not found'
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_error_response_not_json(client, responses):
+    responses['/v2/accounts'] = httpx.Response(
+        502,
+        text='<html>Bad Gateway</html>',
+    )
+
+    with pytest.raises(ioka.StatusError) as error_info:
+        await client.a_get_accounts()
+
+    assert type(error_info.value) is ioka.StatusError
+    assert error_info.value.status_code == 502
+    assert error_info.value.message == '<html>Bad Gateway</html>'
+    assert error_info.value.code == 'Unknown'
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_success_response_not_json(client, responses):
+    responses['/v2/accounts'] = httpx.Response(200, text='<html>OK</html>')
+
+    with pytest.raises(ValueError):
+        await client.a_get_accounts()
+    await client.aclose()
+
+
+@pytest.mark.parametrize(
+    'body',
+    [
+        {'extra_info': {1: 'a'}},
+        {'n': 2 ** 70},
+        {'amount': 1050, 'reason': 'Причина'},
+    ],
+)
+def test_serialize_json_body(body):
+    kwargs = _serialize_json_body({'json': body})
+    request = httpx.Request('post', 'https://ioka.test', **kwargs)
+
+    assert json.loads(request.content) == json.loads(json.dumps(body))
+    assert request.headers['Content-Type'] == 'application/json'
+
+
+class Color(enum.Enum):
+    RED = 'red'
+
+
+@pytest.mark.parametrize(
+    'body',
+    [
+        {'x': float('nan')},
+        {'x': float('inf')},
+        {'x': [float('-inf')]},
+        {'d': datetime.datetime.now()},
+        {'id': uuid.uuid4()},
+        {'color': Color.RED},
+        {datetime.date(2023, 1, 1): 'a'},
+    ],
+)
+def test_serialize_json_body_rejects(body):
+    kwargs = _serialize_json_body({'json': body})
+
+    assert kwargs == {'json': body}
+    with pytest.raises((TypeError, ValueError)):
+        httpx.Request('post', 'https://ioka.test', **kwargs)
+
+
+def test_serialize_json_body_keeps_headers():
+    kwargs = _serialize_json_body({
+        'json': {'amount': 1050},
+        'headers': {'X-Request-Id': 'id'},
+    })
+
+    assert kwargs['headers']['X-Request-Id'] == 'id'
+    assert kwargs['headers']['Content-Type'] == 'application/json'
+
+
+def test_env_proxies(monkeypatch):
+    monkeypatch.setenv('HTTPS_PROXY', 'http://proxy.test:3128')
+    client = ioka.Ioka('api-key')
+
+    assert client._client._mounts
+    assert client._a_client._mounts
+    client.close()
+
+
+@pytest.mark.parametrize(
+    'd_str, expected',
+    [
+        (
+            '2023-01-02T03:04:05',
+            datetime.datetime(2023, 1, 2, 3, 4, 5),
+        ),
+        (
+            '2023-01-02T03:04:05.12',
+            datetime.datetime(2023, 1, 2, 3, 4, 5, 120000),
+        ),
+        (
+            '2023-01-02T03:04:05.1234Z',
+            datetime.datetime(
+                2023, 1, 2, 3, 4, 5, 123400,
+                tzinfo=datetime.timezone.utc,
+            ),
+        ),
+        (
+            '2023-01-02T03:04:05.1234567-02:30',
+            datetime.datetime(
+                2023, 1, 2, 3, 4, 5, 123456,
+                tzinfo=datetime.timezone(-datetime.timedelta(minutes=150)),
+            ),
+        ),
+    ],
+)
+def test_slice_datetime(d_str, expected):
+    parsed = _slice_datetime(d_str)
+
+    assert parsed == expected
+    assert parsed.utcoffset() == expected.utcoffset()
+
+
+@pytest.mark.parametrize(
+    'from_dt, to_dt, expected',
+    [
+        (
+            datetime.date(2023, 1, 1),
+            datetime.date(2023, 1, 31),
+            ('2023-01-01', '2023-01-31'),
+        ),
+        (
+            datetime.datetime(2023, 1, 1, 10),
+            datetime.datetime(2023, 1, 31, 10),
+            ('2023-01-01T10:00:00', '2023-01-31T10:00:00'),
+        ),
+    ],
+)
+def test_pagination_filter_dates(from_dt, to_dt, expected):
+    params = ioka.Ioka('api-key')._prepare_pagination_filter_params(
+        from_dt=from_dt,
+        to_dt=to_dt,
+    )
+
+    assert (params['from_dt'], params['to_dt']) == expected
+
+
+@pytest.mark.parametrize(
+    'd_str',
+    [
+        '2023-01-01T10:00:00+0500',
+        '2023-01-01T10:00:00.123+0500',
+        '2023-01-01T10:00:00.',
+        '2023-01-01T10:00:00.12a',
+    ],
+)
+def test_slice_datetime_rejects_unknown_suffix(d_str):
+    with pytest.raises(ValueError):
+        _slice_datetime(d_str)
+
+
+def test_dict_to_order_payments():
+    order = ioka.Ioka('api-key')._dict_to_order(ORDER)
+
+    assert order.amount.minors == 1050
+    assert all(isinstance(p, ioka.Payment) for p in order.payments)
+    assert [p.id for p in order.payments] == ['payment-id', 'other-payment-id']
+    assert order.payments[0].acquirer == ioka.Acquirer('acquirer', None)
@@ -0,0 +1,40 @@
+import pytest
+
+from ioka import exceptions
+
+
+@pytest.mark.parametrize(
+    'status_code, error_cls',
+    [
+        (400, exceptions.ValidationError),
+        (401, exceptions.UnauthenticatedError),
+        (403, exceptions.UnauthorizedError),
+        (404, exceptions.NotFoundError),
+        (409, exceptions.ConflictError),
+    ],
+)
+def test_get_status_error(status_code, error_cls):
+    error = exceptions.get_status_error(status_code, 'Message', 'Code')
+
+    assert type(error) is error_cls
+    assert error.status_code == status_code
+    assert error.message == 'Message'
+    assert error.code == 'Code'
+
+
+@pytest.mark.parametrize('status_code', [418, 500, 503, 600, 999, -1])
+def test_get_status_error_unmapped(status_code):
+    error = exceptions.get_status_error(status_code, 'Message', 'Code')
+
+    assert type(error) is exceptions.StatusError
+    assert error.status_code == status_code
+
+
+def test_status_error_str_and_repr():
+    error = exceptions.ConflictError('Already exists', 'Conflict')
+
+    assert str(error) == 'Conflict: Already exists'
+    assert repr(error) == (
+        "ConflictError(status_code=409, message='Already exists', "
+        "code='Conflict')"
+    )
@@ -0,0 +1,38 @@
+import subprocess
+import sys
+
+import ioka
+
+
+def test_public_api_surface():
+    assert all(hasattr(ioka, name) for name in ioka.__all__)
+
+
+def test_star_import():
+    namespace = {}
+    exec('from ioka import *', namespace)
+
+    assert set(ioka.__all__) <= namespace.keys()
+
+
+def test_lazy_import():
+    # A fresh interpreter, the test session has the submodules loaded.
+    code = (
+        'import sys, ioka; '
+        "print(sorted(m for m in ('httpx', 'ioka.client', 'ioka.models') "
+        'if m in sys.modules))'
+    )
+    output = subprocess.check_output([sys.executable, '-c', code], text=True)
+
+    assert output.strip() == '[]'
+
+
+def test_submodule_attributes():
+    code = (
+        'import ioka; '
+        'print(ioka.exceptions.StatusError.__name__, '
+        'ioka.models.KZT.__name__, ioka.client.Ioka.__name__)'
+    )
+    output = subprocess.check_output([sys.executable, '-c', code], text=True)
+
+    assert output.split() == ['StatusError', 'KZT', 'Ioka']
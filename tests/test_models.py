@@ -0,0 +1,113 @@
+import datetime
+import decimal
+
+import pytest
+
+from ioka import models
+
+
+@pytest.mark.parametrize(
+    'value, minors',
+    [
+        (10, 1000),
+        (10.07, 1007),
+        (0.285, 29),
+        (decimal.Decimal('1.005'), 101),
+        (-3.335, -334),
+    ],
+)
+def test_money_minors(value, minors):
+    assert models.KZT(value).minors == minors
+
+
+def test_money_from_minor():
+    money = models.USD.from_minor(1050)
+
+    assert money.minors == 1050
+    assert money.value == decimal.Decimal('10.5')
+    assert repr(money) == 'USD(10.5)'
+
+
+def test_money_from_minor_zero():
+    assert models.EUR.from_minor(0) is models.EUR.ZERO
+    assert models.EUR.ZERO.minors == 0
+    assert models.RUB.ZERO is not models.EUR.ZERO
+
+
+def test_enum_from_str():
+    assert models.OrderStatus.from_str('PAID') is models.OrderStatus.PAID
+    assert models.EventName.from_str(
+        models.EventName.ORDER_PAID.value,
+    ) is models.EventName.ORDER_PAID
+
+
+def test_enum_from_str_unknown():
+    with pytest.raises(ValueError):
+        models.OrderStatus.from_str('UNKNOWN_STATUS')
+
+
+class CaptureClient:
+    def __init__(self):
+        self.captured = []
+
+    def capture_order(self, order_id, amount, reason=None):
+        self.captured.append((order_id, amount, reason))
+
+    async def a_capture_order(self, order_id, amount, reason=None):
+        self.captured.append((order_id, amount, reason))
+
+
+def make_order(client):
+    return models.Order(
+        client=client,
+        id='order-id',
+        shop_id='shop-id',
+        status=models.OrderStatus.PAID,
+        created_at=datetime.datetime(2023, 1, 1),
+        amount=models.KZT(100),
+        capture_method=models.CaptureMethod.MANUAL,
+        external_id=None,
+        description=None,
+        extra_info=None,
+        mcc=None,
+        acquirer=None,
+        customer_id=None,
+        card_id=None,
+        attempts=None,
+        checkout_url='https://checkout',
+        payments=None,
+    )
+
+
+def test_order_capture_full_amount():
+    client = CaptureClient()
+    order = make_order(client)
+    order.capture()
+
+    assert client.captured == [('order-id', order.amount, None)]
+
+
+def test_order_capture_partial_amount():
+    client = CaptureClient()
+    amount = models.KZT(40)
+    make_order(client).capture(amount, reason='Partial')
+
+    assert client.captured == [('order-id', amount, 'Partial')]
+
+
+@pytest.mark.asyncio
+async def test_order_a_capture_full_amount():
+    client = CaptureClient()
+    order = make_order(client)
+    await order.a_capture()
+
+    assert client.captured == [('order-id', order.amount, None)]
+
+
+@pytest.mark.asyncio
+async def test_order_a_capture_partial_amount():
+    client = CaptureClient()
+    amount = models.KZT(40)
+    await make_order(client).a_capture(amount, reason='Partial')
+
+    assert client.captured == [('order-id', amount, 'Partial')]